@@ -0,0 +1,163 @@
+"""
+KABUL Card Game - German Content
+================================
+
+All German card text. Edit the content below to update every PDF
+edition automatically; main.py loads this module when LANGUAGE = "de".
+"""
+
+
+# Card 1 value table: (label, value, action, red symbols)
+CARD_1_VALUES = [
+    ("Joker", "-1 Punkt", None, False),
+    ("Ass", "1 Punkt", None, False),
+    ("2–6", "Kartenwert", None, False),
+    ("7, 8", "Kartenwert", "Eigene ansehen", False),
+    ("9, 10", "Kartenwert", "Fremde ansehen", False),
+    ("Bube, Dame", "10 Punkte", "Tauschen", False),
+    ("König ♠♣", "10 Punkte", "2× Ansehen & Tauschen?", False),
+    ("König ♥♦", "0 Punkte", None, True),
+]
+
+
+CONTENT = {
+    "CARD_1": {
+        "title": "Kartenwerte & Aktionen",
+        "type": "values_table",
+        "values": CARD_1_VALUES,
+        "footer_sections": [
+            {"heading": "Ziel", "content": "Niedrigste Gesamtpunktzahl"},
+            {"heading": "Ende", "content": "Erster Spieler > 100 Punkte"},
+        ]
+    },
+    "CARD_2": {
+        "title": "Spielablauf",
+        "type": "sections",
+        "sections": [
+            {
+                "heading": "Setup",
+                "content": [
+                    "4 Karten verdeckt im Quadrat",
+                    "Untere 2 Karten einmal ansehen",
+                    "Erste Karte vom Stapel aufdecken"
+                ]
+            },
+            {
+                "heading": "Spielzug",
+                "content": [
+                    "1. Karte ziehen von Stapel o. Ablage",
+                    "2. Wählen: Ablegen, Ersetzen",
+                    "   oder Kartenaktion ausführen"
+                ]
+            },
+            {
+                "heading": "Abwerfen",
+                "content": [
+                    "Gleiche Karte wie auf der Ablage?",
+                    "→ Eigene/fremde Karte draufschmeißen!",
+                    "Schnellster gewinnt · 1× pro Abwerfen"
+                ]
+            },
+            {
+                "heading": "Kabul",
+                "content": [
+                    "Bei ≤4 Punkten: Kabul rufen",
+                    "→ Löst letzte Runde aus"
+                ]
+            }
+        ]
+    },
+    "CARD_3": {
+        "title": "Detailregeln",
+        "type": "sections",
+        "sections": [
+            {
+                "heading": "Abwerfen-Details",
+                "content": [
+                    "Auch fremde Karten abwerfbar",
+                    "Eigene Karte als Ersatz geben",
+                    "Schnellster gewinnt",
+                    "Berührt Ablage = gültig",
+                    "Zählt nicht als Spielzug"
+                ]
+            },
+            {
+                "heading": "Karte ersetzen",
+                "content": [
+                    "Sofort umdrehen & zeigen",
+                    "Nicht erst anschauen!"
+                ]
+            },
+            {
+                "heading": "Sonderfälle",
+                "content": [
+                    "Stapel leer → Ablage mischen",
+                    "Keine Karten mehr → Kabul (Pflicht)"
+                ]
+            }
+        ]
+    },
+    "CARD_4": {
+        "title": "Strafen & Regeln",
+        "type": "sections",
+        "sections": [
+            {
+                "heading": "Strafen (+1 Karte)",
+                "content": [
+                    "Setup: Karten 2× angesehen",
+                    "Falsches Abwerfen"
+                ]
+            },
+            {
+                "heading": "Kabul-Strafe",
+                "content": [
+                    "Nicht niedrigste Anzahl oder >4 Punkte?",
+                    "→ Kartenzahl verdoppelt",
+                    "oder",
+                    "→ Nächste Runde: 5 Karten"
+                ]
+            },
+            {
+                "heading": "Wichtig",
+                "content": [
+                    "Kabul erst ab ≤4 Punkte rufbar",
+                    "Am Ende: Bestätigung nötig",
+                    "Nach Abwerfen: Eigener Zug möglich",
+                    "Kartenaktion = Ablegen + Aktion"
+                ]
+            },
+            {
+                "heading": "Gleichstand",
+                "content": ["Der, der Kabul gerufen hat gewinnt"]
+            }
+        ]
+    },
+    "BACK_TITLE": "KABUL",
+    "BACK_SUBTITLE": "Kartenspiel",
+    "TITLE_CARD_TITLE": "KABUL",
+    "TITLE_CARD_SUBTITLE": "Spielregeln",
+    "GITHUB_URL": "https://github.com/hazelwalker/kabul-instructions",
+    "GAME_DESCRIPTION": [
+        "KABUL ist ein schnelles Kartenspiel für 2-6 Spieler,",
+        "inspiriert von Cabo, Skyjo oder Golf. Ziel ist es, die",
+        "niedrigste Punktzahl zu erreichen – aber Vorsicht:",
+        "Du kennst nicht alle deine Karten!",
+        "",
+        "Merke dir deine Karten, tausche clever und rufe",
+        "»Kabul!«, wenn du glaubst zu gewinnen.",
+        "",
+        "Spieldauer: ca. 15-20 Minuten",
+    ],
+    "ABOUT_TITLE": "Über das Spiel",
+    "PAGE_INFO": {
+        "4card_front": "Vorderseiten",
+        "4card_back": "Rückseiten",
+        "4card_edition": "Regelkarten",
+        "2card_front": "Vorderseiten: Kartenwerte | Detailregeln",
+        "2card_back": "Rückseiten: Spielablauf | Strafen",
+        "2card_edition": "Kompakt",
+        "title_front": "Vorderseite",
+        "title_back": "Rückseite",
+        "duplex_hint": "↻ Duplex: Lange Kante spiegeln",
+    },
+}
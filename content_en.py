@@ -0,0 +1,163 @@
+"""
+KABUL Card Game - English Content
+=================================
+
+All English card text. Edit the content below to update every PDF
+edition automatically; main.py loads this module when LANGUAGE = "en".
+"""
+
+
+# Card 1 value table: (label, value, action, red symbols)
+CARD_1_VALUES = [
+    ("Joker", "-1 Point", None, False),
+    ("Ace", "1 Point", None, False),
+    ("2–6", "Face Value", None, False),
+    ("7, 8", "Face Value", "View own card", False),
+    ("9, 10", "Face Value", "View other's card", False),
+    ("Jack, Queen", "10 Points", "Swap cards", False),
+    ("King ♠♣", "10 Points", "2× View & Swap?", False),
+    ("King ♥♦", "0 Points", None, True),
+]
+
+
+CONTENT = {
+    "CARD_1": {
+        "title": "Card Values & Actions",
+        "type": "values_table",
+        "values": CARD_1_VALUES,
+        "footer_sections": [
+            {"heading": "Goal", "content": "Lowest total score"},
+            {"heading": "End", "content": "First player > 100 points"},
+        ]
+    },
+    "CARD_2": {
+        "title": "Gameplay",
+        "type": "sections",
+        "sections": [
+            {
+                "heading": "Setup",
+                "content": [
+                    "4 cards face-down in a square",
+                    "Look at bottom 2 cards once",
+                    "Flip first card from draw pile"
+                ]
+            },
+            {
+                "heading": "Turn",
+                "content": [
+                    "1. Draw card from pile or discard",
+                    "2. Choose: Discard, Replace",
+                    "   or use card action"
+                ]
+            },
+            {
+                "heading": "Smash",
+                "content": [
+                    "Same card as on discard pile?",
+                    "→ Smash your/other's card on top!",
+                    "Fastest wins · 1× per smash"
+                ]
+            },
+            {
+                "heading": "Kabul",
+                "content": [
+                    "At ≤4 points: Call Kabul",
+                    "→ Triggers final round"
+                ]
+            }
+        ]
+    },
+    "CARD_3": {
+        "title": "Detailed Rules",
+        "type": "sections",
+        "sections": [
+            {
+                "heading": "Smash Details",
+                "content": [
+                    "Can smash other players' cards too",
+                    "Give own card as replacement",
+                    "Fastest player wins",
+                    "Touching discard = valid",
+                    "Does not count as turn"
+                ]
+            },
+            {
+                "heading": "Replace Card",
+                "content": [
+                    "Flip immediately & show",
+                    "Don't peek first!"
+                ]
+            },
+            {
+                "heading": "Special Cases",
+                "content": [
+                    "Draw pile empty → Shuffle discard",
+                    "No cards left → Kabul (mandatory)"
+                ]
+            }
+        ]
+    },
+    "CARD_4": {
+        "title": "Penalties & Rules",
+        "type": "sections",
+        "sections": [
+            {
+                "heading": "Penalties (+1 Card)",
+                "content": [
+                    "Setup: Looked at cards twice",
+                    "Wrong smash"
+                ]
+            },
+            {
+                "heading": "Kabul Penalty",
+                "content": [
+                    "Not lowest or >4 points?",
+                    "→ Double your card count",
+                    "or",
+                    "→ Next round: 5 cards"
+                ]
+            },
+            {
+                "heading": "Important",
+                "content": [
+                    "Kabul only callable at ≤4 points",
+                    "End: Confirmation required",
+                    "After smash: Own turn possible",
+                    "Card action = Discard + Action"
+                ]
+            },
+            {
+                "heading": "Tie",
+                "content": ["Kabul caller wins"]
+            }
+        ]
+    },
+    "BACK_TITLE": "KABUL",
+    "BACK_SUBTITLE": "Card Game",
+    "TITLE_CARD_TITLE": "KABUL",
+    "TITLE_CARD_SUBTITLE": "Game Rules",
+    "GITHUB_URL": "https://github.com/hazelwalker/kabul-instructions",
+    "GAME_DESCRIPTION": [
+        "KABUL is a fast-paced card game for 2-6 players,",
+        "inspired by Cabo, Skyjo and Golf. The goal is to achieve",
+        "the lowest score – but beware:",
+        "You don't know all your cards!",
+        "",
+        "Memorize your cards, swap cleverly, and call",
+        "»Kabul!« when you think you'll win.",
+        "",
+        "Duration: approx. 15-20 minutes",
+    ],
+    "ABOUT_TITLE": "About the Game",
+    "PAGE_INFO": {
+        "4card_front": "Front Sides",
+        "4card_back": "Back Sides",
+        "4card_edition": "Rule Cards",
+        "2card_front": "Front: Card Values | Detailed Rules",
+        "2card_back": "Back: Gameplay | Penalties",
+        "2card_edition": "Compact",
+        "title_front": "Front Side",
+        "title_back": "Back Side",
+        "duplex_hint": "↻ Duplex: Long Edge Flip",
+    },
+}
@@ -24,14 +24,24 @@ Print settings:
 from reportlab.lib.pagesizes import mm, A4
 from reportlab.lib.colors import HexColor
 from reportlab.pdfgen import canvas
+from reportlab.pdfgen.pathobject import PDFPathObject
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.graphics.barcode import qr
-from reportlab.graphics.shapes import Drawing
-from reportlab.graphics import renderPDF
+from reportlab import rl_config
+# Skip attribute validation on graphics shapes (content is fixed and trusted).
+# Must be set before reportlab.graphics is imported (by the QR encoder).
+rl_config.shapeChecking = 0
+import collections
+import concurrent.futures
+import functools
+import importlib
+import io
+import logging
 import os
 import sys
 
+_log = logging.getLogger(__name__)
+
 
 # =============================================================================
 # CONFIGURATION - Edit these values to customize output
@@ -42,6 +52,15 @@ LANGUAGE = "de"
 
 OUTPUT_DIR = "./cards"  # Current directory (change as needed)
 
+# Flate-compress page streams: much smaller PDFs for a little CPU time.
+# Set to 0 only to inspect raw content streams. (Byte-reproducible output
+# would additionally need Canvas(invariant=1), which is left off.)
+PAGE_COMPRESSION = 1
+
+# Clip card backgrounds to the bleed area. The decorations are forms whose
+# bounding box is the bleed area, so this is only a debugging aid.
+CLIP_TO_BLEED = False
+
 # Card dimensions (Poker standard: 63x88mm)
 CARD_WIDTH = 63 * mm
 CARD_HEIGHT = 88 * mm
@@ -97,6 +116,10 @@ class Colors:
 
     # Print marks
     crop_mark = HexColor("#000000")
+    page_info = HexColor("#999999")   # Page footer text
+
+    # QR code modules (title card back)
+    qr_code = HexColor("#000000")
 
 
 # =============================================================================
@@ -125,455 +148,331 @@ class Fonts:
 # CARD CONTENT - Bilingual (German / English)
 # =============================================================================
 #
-# Edit the content below to update BOTH PDF editions automatically.
-# Change LANGUAGE at the top to switch between "de" and "en".
+# The card text lives in one module per language (content_de.py, content_en.py).
+# Edit those to update ALL PDF editions automatically.
+# Change LANGUAGE at the top to switch between "de" and "en"; only the module
+# for the active language is imported.
 #
 # =============================================================================
 
-CONTENT = {
-    # =========================================================================
-    # GERMAN CONTENT
-    # =========================================================================
-    "de": {
-        "card_1_values": [
-            ("Joker", "-1 Punkt", None, False),
-            ("Ass", "1 Punkt", None, False),
-            ("2–6", "Kartenwert", None, False),
-            ("7, 8", "Kartenwert", "Eigene ansehen", False),
-            ("9, 10", "Kartenwert", "Fremde ansehen", False),
-            ("Bube, Dame", "10 Punkte", "Tauschen", False),
-            ("König ♠♣", "10 Punkte", "2× Ansehen & Tauschen?", False),
-            ("König ♥♦", "0 Punkte", None, True),
-        ],
-        "card_1": {
-            "title": "Kartenwerte & Aktionen",
-            "type": "values_table",
-            "footer_sections": [
-                {"heading": "Ziel", "content": "Niedrigste Gesamtpunktzahl"},
-                {"heading": "Ende", "content": "Erster Spieler > 100 Punkte"},
-            ]
-        },
-        "card_2": {
-            "title": "Spielablauf",
-            "type": "sections",
-            "sections": [
-                {
-                    "heading": "Setup",
-                    "content": [
-                        "4 Karten verdeckt im Quadrat",
-                        "Untere 2 Karten einmal ansehen",
-                        "Erste Karte vom Stapel aufdecken"
-                    ]
-                },
-                {
-                    "heading": "Spielzug",
-                    "content": [
-                        "1. Karte ziehen von Stapel o. Ablage",
-                        "2. Wählen: Ablegen, Ersetzen",
-                        "   oder Kartenaktion ausführen"
-                    ]
-                },
-                {
-                    "heading": "Abwerfen",
-                    "content": [
-                        "Gleiche Karte wie auf der Ablage?",
-                        "→ Eigene/fremde Karte draufschmeißen!",
-                        "Schnellster gewinnt · 1× pro Abwerfen"
-                    ]
-                },
-                {
-                    "heading": "Kabul",
-                    "content": [
-                        "Bei ≤4 Punkten: Kabul rufen",
-                        "→ Löst letzte Runde aus"
-                    ]
-                }
-            ]
-        },
-        "card_3": {
-            "title": "Detailregeln",
-            "type": "sections",
-            "sections": [
-                {
-                    "heading": "Abwerfen-Details",
-                    "content": [
-                        "Auch fremde Karten abwerfbar",
-                        "Eigene Karte als Ersatz geben",
-                        "Schnellster gewinnt",
-                        "Berührt Ablage = gültig",
-                        "Zählt nicht als Spielzug"
-                    ]
-                },
-                {
-                    "heading": "Karte ersetzen",
-                    "content": [
-                        "Sofort umdrehen & zeigen",
-                        "Nicht erst anschauen!"
-                    ]
-                },
-                {
-                    "heading": "Sonderfälle",
-                    "content": [
-                        "Stapel leer → Ablage mischen",
-                        "Keine Karten mehr → Kabul (Pflicht)"
-                    ]
-                }
-            ]
-        },
-        "card_4": {
-            "title": "Strafen & Regeln",
-            "type": "sections",
-            "sections": [
-                {
-                    "heading": "Strafen (+1 Karte)",
-                    "content": [
-                        "Setup: Karten 2× angesehen",
-                        "Falsches Abwerfen"
-                    ]
-                },
-                {
-                    "heading": "Kabul-Strafe",
-                    "content": [
-                        "Nicht niedrigste Anzahl oder >4 Punkte?",
-                        "→ Kartenzahl verdoppelt",
-                        "oder",
-                        "→ Nächste Runde: 5 Karten"
-                    ]
-                },
-                {
-                    "heading": "Wichtig",
-                    "content": [
-                        "Kabul erst ab ≤4 Punkte rufbar",
-                        "Am Ende: Bestätigung nötig",
-                        "Nach Abwerfen: Eigener Zug möglich",
-                        "Kartenaktion = Ablegen + Aktion"
-                    ]
-                },
-                {
-                    "heading": "Gleichstand",
-                    "content": ["Der, der Kabul gerufen hat gewinnt"]
-                }
-            ]
-        },
-        "back_title": "KABUL",
-        "back_subtitle": "Kartenspiel",
-        "title_card_title": "KABUL",
-        "title_card_subtitle": "Spielregeln",
-        "github_url": "https://github.com/hazelwalker/kabul-instructions",
-        "game_description": [
-            "KABUL ist ein schnelles Kartenspiel für 2-6 Spieler,",
-            "inspiriert von Cabo, Skyjo oder Golf. Ziel ist es, die",
-            "niedrigste Punktzahl zu erreichen – aber Vorsicht:",
-            "Du kennst nicht alle deine Karten!",
-            "",
-            "Merke dir deine Karten, tausche clever und rufe",
-            "»Kabul!«, wenn du glaubst zu gewinnen.",
-            "",
-            "Spieldauer: ca. 15-20 Minuten",
-        ],
-        "about_title": "Über das Spiel",
-        "page_info": {
-            "4card_front": "Vorderseiten",
-            "4card_back": "Rückseiten",
-            "4card_edition": "Regelkarten",
-            "2card_front": "Vorderseiten: Kartenwerte | Detailregeln",
-            "2card_back": "Rückseiten: Spielablauf | Strafen",
-            "2card_edition": "Kompakt",
-            "title_front": "Vorderseite",
-            "title_back": "Rückseite",
-            "duplex_hint": "↻ Duplex: Lange Kante spiegeln",
-        }
-    },
-
-    # =========================================================================
-    # ENGLISH CONTENT
-    # =========================================================================
-    "en": {
-        "card_1_values": [
-            ("Joker", "-1 Point", None, False),
-            ("Ace", "1 Point", None, False),
-            ("2–6", "Face Value", None, False),
-            ("7, 8", "Face Value", "View own card", False),
-            ("9, 10", "Face Value", "View other's card", False),
-            ("Jack, Queen", "10 Points", "Swap cards", False),
-            ("King ♠♣", "10 Points", "2× View & Swap?", False),
-            ("King ♥♦", "0 Points", None, True),
-        ],
-        "card_1": {
-            "title": "Card Values & Actions",
-            "type": "values_table",
-            "footer_sections": [
-                {"heading": "Goal", "content": "Lowest total score"},
-                {"heading": "End", "content": "First player > 100 points"},
-            ]
-        },
-        "card_2": {
-            "title": "Gameplay",
-            "type": "sections",
-            "sections": [
-                {
-                    "heading": "Setup",
-                    "content": [
-                        "4 cards face-down in a square",
-                        "Look at bottom 2 cards once",
-                        "Flip first card from draw pile"
-                    ]
-                },
-                {
-                    "heading": "Turn",
-                    "content": [
-                        "1. Draw card from pile or discard",
-                        "2. Choose: Discard, Replace",
-                        "   or use card action"
-                    ]
-                },
-                {
-                    "heading": "Smash",
-                    "content": [
-                        "Same card as on discard pile?",
-                        "→ Smash your/other's card on top!",
-                        "Fastest wins · 1× per smash"
-                    ]
-                },
-                {
-                    "heading": "Kabul",
-                    "content": [
-                        "At ≤4 points: Call Kabul",
-                        "→ Triggers final round"
-                    ]
-                }
-            ]
-        },
-        "card_3": {
-            "title": "Detailed Rules",
-            "type": "sections",
-            "sections": [
-                {
-                    "heading": "Smash Details",
-                    "content": [
-                        "Can smash other players' cards too",
-                        "Give own card as replacement",
-                        "Fastest player wins",
-                        "Touching discard = valid",
-                        "Does not count as turn"
-                    ]
-                },
-                {
-                    "heading": "Replace Card",
-                    "content": [
-                        "Flip immediately & show",
-                        "Don't peek first!"
-                    ]
-                },
-                {
-                    "heading": "Special Cases",
-                    "content": [
-                        "Draw pile empty → Shuffle discard",
-                        "No cards left → Kabul (mandatory)"
-                    ]
-                }
-            ]
-        },
-        "card_4": {
-            "title": "Penalties & Rules",
-            "type": "sections",
-            "sections": [
-                {
-                    "heading": "Penalties (+1 Card)",
-                    "content": [
-                        "Setup: Looked at cards twice",
-                        "Wrong smash"
-                    ]
-                },
-                {
-                    "heading": "Kabul Penalty",
-                    "content": [
-                        "Not lowest or >4 points?",
-                        "→ Double your card count",
-                        "or",
-                        "→ Next round: 5 cards"
-                    ]
-                },
-                {
-                    "heading": "Important",
-                    "content": [
-                        "Kabul only callable at ≤4 points",
-                        "End: Confirmation required",
-                        "After smash: Own turn possible",
-                        "Card action = Discard + Action"
-                    ]
-                },
-                {
-                    "heading": "Tie",
-                    "content": ["Kabul caller wins"]
-                }
-            ]
-        },
-        "back_title": "KABUL",
-        "back_subtitle": "Card Game",
-        "title_card_title": "KABUL",
-        "title_card_subtitle": "Game Rules",
-        "github_url": "https://github.com/hazelwalker/kabul-instructions",
-        "game_description": [
-            "KABUL is a fast-paced card game for 2-6 players,",
-            "inspired by Cabo, Skyjo and Golf. The goal is to achieve",
-            "the lowest score – but beware:",
-            "You don't know all your cards!",
-            "",
-            "Memorize your cards, swap cleverly, and call",
-            "»Kabul!« when you think you'll win.",
-            "",
-            "Duration: approx. 15-20 minutes",
-        ],
-        "about_title": "About the Game",
-        "page_info": {
-            "4card_front": "Front Sides",
-            "4card_back": "Back Sides",
-            "4card_edition": "Rule Cards",
-            "2card_front": "Front: Card Values | Detailed Rules",
-            "2card_back": "Back: Gameplay | Penalties",
-            "2card_edition": "Compact",
-            "title_front": "Front Side",
-            "title_back": "Back Side",
-            "duplex_hint": "↻ Duplex: Long Edge Flip",
-        }
-    }
-}
+# Card content is parsed into these once when the content is loaded
+Section = collections.namedtuple("Section", "heading lines")
+Line = collections.namedtuple("Line", "indent is_arrow text")
+Value = collections.namedtuple("Value", "label value action_display has_red")
 
 
-# =============================================================================
-# ACTIVE CONTENT (loaded based on LANGUAGE setting)
-# =============================================================================
+def _parse_line(line):
+    """
+    Parse one section content line: a leading "   " indents it, and a
+    leading "→ " is drawn as an accent-colored arrow before the text.
+    """
+    indent = line.startswith("   ")
+    if indent:
+        line = line.strip()
+    if line.startswith("→"):
+        return Line(indent, True, line[2:])
+    return Line(indent, False, line)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_content(language):
+    """
+    Import the content module for a language (once per language).
+
+    Section content is parsed into Section/Line tuples and value table rows
+    into Value tuples with the "→ action" text ready to draw, so drawing
+    does not have to inspect or build the strings again.
+    """
+    content = dict(importlib.import_module(f"content_{language}").CONTENT)
+    for key, card_data in content.items():
+        if isinstance(card_data, dict) and card_data.get("type") == "values_table":
+            content[key] = dict(card_data, values=[
+                Value(label, value, f"→ {action}" if action else None, has_red)
+                for label, value, action, has_red in card_data["values"]
+            ])
+        elif isinstance(card_data, dict) and card_data.get("type") == "sections":
+            content[key] = dict(card_data, sections=[
+                Section(section["heading"], [_parse_line(line) for line in section["content"]])
+                for section in card_data["sections"]
+            ])
+    return content
+
 
 def get_content():
     """Get content for the selected language."""
-    lang = CONTENT[LANGUAGE]
-
-    # Build CARD_1 with values
-    card_1 = lang["card_1"].copy()
-    card_1["values"] = lang["card_1_values"]
-
-    return {
-        "CARD_1": card_1,
-        "CARD_2": lang["card_2"],
-        "CARD_3": lang["card_3"],
-        "CARD_4": lang["card_4"],
-        "BACK_TITLE": lang["back_title"],
-        "BACK_SUBTITLE": lang["back_subtitle"],
-        "TITLE_CARD_TITLE": lang["title_card_title"],
-        "TITLE_CARD_SUBTITLE": lang["title_card_subtitle"],
-        "GITHUB_URL": lang["github_url"],
-        "GAME_DESCRIPTION": lang["game_description"],
-        "ABOUT_TITLE": lang["about_title"],
-        "PAGE_INFO": lang["page_info"],
-    }
+    return _load_content(LANGUAGE)
 
 
 # =============================================================================
 # FONT REGISTRATION - Cross-platform (Windows + Linux)
 # =============================================================================
 
+# Font files per platform: (registered name, path)
+_WIN_FONTS = (
+    ('CardFont', 'C:/Windows/Fonts/arial.ttf'),
+    ('CardFont-Bold', 'C:/Windows/Fonts/arialbd.ttf'),
+)
+_LINUX_FONTS = (
+    ('CardFont', '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'),
+    ('CardFont-Bold', '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'),
+)
+
+# Set once register_fonts() has run; fonts stay registered for the process
+_FONTS_REGISTERED = False
+
+
 def register_fonts():
     """
     Register fonts for PDF generation.
 
-    Tries Windows fonts first (Arial), then Linux fonts (DejaVuSans).
-    Falls back to Helvetica if nothing else works.
-    """
-    fonts_registered = False
-
-    # Windows font paths
-    windows_fonts = {
-        'CardFont': 'C:/Windows/Fonts/arial.ttf',
-        'CardFont-Bold': 'C:/Windows/Fonts/arialbd.ttf',
-    }
+    Uses the current platform's fonts (Arial on Windows, DejaVuSans
+    elsewhere) if all of them are present, else the other platform's, so
+    the two families are never mixed. Falls back to Helvetica if neither
+    set is complete.
 
-    # Linux font paths
-    linux_fonts = {
-        'CardFont': '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
-        'CardFont-Bold': '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
-    }
+    Only does work on the first call per process.
+    """
+    global _FONTS_REGISTERED
+    if _FONTS_REGISTERED:
+        return
 
-    # Try Windows fonts first
     if sys.platform == 'win32':
-        font_paths = windows_fonts
+        primary, fallback = _WIN_FONTS, _LINUX_FONTS
     else:
-        font_paths = linux_fonts
-
-    for name, path in font_paths.items():
-        if os.path.exists(path):
-            try:
+        primary, fallback = _LINUX_FONTS, _WIN_FONTS
+
+    # One stat per font file; only a complete set is parsed and registered
+    for font_table in (primary, fallback):
+        missing = [path for _, path in font_table if not os.path.exists(path)]
+        if missing:
+            if font_table is primary:
+                _log.warning("Could not find fonts: %s", ", ".join(missing))
+            continue
+        try:
+            for name, path in font_table:
                 pdfmetrics.registerFont(TTFont(name, path))
-                fonts_registered = True
-            except Exception as e:
-                print(f"Warning: Could not register font {name}: {e}")
-
-    # Fallback: try the other platform's fonts
-    if not fonts_registered:
-        fallback = linux_fonts if sys.platform == 'win32' else windows_fonts
-        for name, path in fallback.items():
-            if os.path.exists(path):
-                try:
-                    pdfmetrics.registerFont(TTFont(name, path))
-                    fonts_registered = True
-                except:
-                    pass
-
-    # Ultimate fallback: use Helvetica (built into ReportLab)
-    if not fonts_registered:
-        print("Warning: Using Helvetica as fallback font")
+        except Exception as e:
+            _log.warning("Could not register font %s: %s", name, e)
+            continue
+        break
+    else:
+        # Ultimate fallback: use Helvetica (built into ReportLab)
+        _log.info("Using Helvetica as fallback font")
         Fonts.title = "Helvetica-Bold"
         Fonts.heading = "Helvetica-Bold"
         Fonts.body = "Helvetica"
 
+    _FONTS_REGISTERED = True
+
+
+# =============================================================================
+# DRAWING CONSTANTS - Precomputed offsets (don't edit)
+# =============================================================================
+#
+# Offsets relative to the card's cut corner, computed once at import instead
+# of on every card.
+
+CARD_HALF_W = CARD_WIDTH / 2
+CARD_HALF_H = CARD_HEIGHT / 2
+CROP_REACH = CROP_OFFSET + CROP_LENGTH   # Outer end of a crop mark
+
+# Front side
+ACCENT_BAR_HEIGHT = 3.5 * mm
+ACCENT_BAR_Y = CARD_HEIGHT - ACCENT_BAR_HEIGHT
+FRONT_CIRCLE_X = 50 * mm
+FRONT_CIRCLE_Y = 20 * mm
+FRONT_CIRCLE_R = 12 * mm
+# Waves run from the left to the right bleed edge; each is given as
+# (start y, control point 1 x/y, control point 2 x/y, end y)
+FRONT_WAVE_BACK = (25 * mm, 20 * mm, 35 * mm, 35 * mm, 50 * mm, 60 * mm)
+FRONT_WAVE_FRONT = (15 * mm, 25 * mm, 22 * mm, 40 * mm, 35 * mm, 45 * mm)
+
+# Back side / title card
+BACK_CIRCLE_X = 50 * mm
+BACK_CIRCLE_Y = 22 * mm
+BACK_CIRCLE_R = 10 * mm
+BACK_WAVE_1 = (30 * mm, 20 * mm, 40 * mm, 40 * mm, 55 * mm, 65 * mm)
+BACK_WAVE_2 = (18 * mm, 25 * mm, 25 * mm, 45 * mm, 38 * mm, 48 * mm)
+BACK_TITLE_Y = CARD_HALF_H + 5 * mm
+BACK_SUBTITLE_Y = CARD_HALF_H - 5 * mm
+TITLE_CARD_TITLE_Y = CARD_HALF_H + 8 * mm
+TITLE_CARD_SUBTITLE_Y = CARD_HALF_H - 4 * mm
+
+# Title card back
+ABOUT_TITLE_Y = CARD_HEIGHT - 12 * mm
+DESCRIPTION_Y = CARD_HEIGHT - 20 * mm
+DESCRIPTION_LINE = 3.2 * mm       # Line advance for description text
+DESCRIPTION_GAP = 2 * mm          # Advance for an empty description line
+QR_SIZE = 18 * mm                 # Including the quiet zone
+QR_BORDER = 4                     # Quiet zone in modules
+QR_X = (CARD_WIDTH - QR_SIZE) / 2
+QR_Y = 12 * mm
+QR_LABEL_Y = 8 * mm
+
+# Front side text
+TITLE_Y = CARD_HEIGHT - 11 * mm
+SUBTITLE_Y = CARD_HEIGHT - 16.5 * mm
+NUMBER_X = CARD_WIDTH - MARGIN - 0.5 * mm   # Right edge of the card number
+NUMBER_Y = MARGIN + 1 * mm
+CONTENT_Y = CARD_HEIGHT - 21 * mm           # First line of the card body
+TEXT_X = MARGIN + 1 * mm                    # Left edge of the card body
+EQUALS_X = 24 * mm                # Value table "=" column
+VALUE_X = 27 * mm                 # Value table value/action column
+VALUE_LINE = 3.2 * mm             # Line advance per value table row
+ACTION_LINE = 2.8 * mm            # Advance to the action below a value
+FOOTER_GAP = 1.5 * mm             # Gap between value table and footer sections
+FOOTER_LINE = 3.5 * mm            # Line advance per footer section
+HEADING_LINE = 3.3 * mm           # Advance after a section heading
+SECTION_LINE = 2.9 * mm           # Line advance for section content
+SECTION_GAP = 1.2 * mm            # Extra gap after each section
+INDENT = 2.5 * mm                 # Indent for lines starting with "   "
+ARROW_GAP = 3 * mm                # Text offset after a leading "→"
+
+# Page footer
+PAGE_INFO_X = 15 * mm             # Inset from the left and right page edge
+PAGE_INFO_Y = 10 * mm
+PAGE_INFO_FORMAT = "KABUL {edition} | Page {page}/{total} | {description} | 63×88mm"
+
+
+# =============================================================================
+# CANVAS
+# =============================================================================
+
+class StatefulCanvas(canvas.Canvas):
+    """
+    Canvas that skips fill color and font changes to the state already in
+    effect.
+
+    The fill color is compared by identity, so drawing code should use the
+    shared Colors attributes. The canvas already keeps the current fill and
+    font in _fillColorObj/_fontname/_fontsize and saves/restores them with
+    saveState/restoreState, forms and page breaks. Text objects that set
+    their own fill or font are synced in drawText, since both stay in
+    effect after the text block.
+    """
+
+    def setFillColor(self, aColor, alpha=None):
+        if aColor is self._fillColorObj and alpha is None:
+            return
+        super().setFillColor(aColor, alpha)
+
+    def setFont(self, psfontname, size, leading=None):
+        if leading is None:
+            leading = size * 1.2
+        if (psfontname == self._fontname and size == self._fontsize
+                and leading == self._leading):
+            return
+        super().setFont(psfontname, size, leading)
+
+    def beginForm(self, name, lowerx=0, lowery=0, upperx=None, uppery=None):
+        super().beginForm(name, lowerx, lowery, upperx, uppery)
+        # A form inherits the font of wherever it is used, so the first
+        # setFont inside it must always be emitted
+        self._fontsize = None
+
+    def drawText(self, aTextObject):
+        super().drawText(aTextObject)
+        fill = getattr(aTextObject, "_fillColorObj", None)
+        if fill is not None:
+            self._fillColorObj = fill
+        self._fontname = aTextObject._fontname
+        self._fontsize = aTextObject._fontsize
+        self._leading = aTextObject._leading
+
+
+# =============================================================================
+# TEXT METRICS
+# =============================================================================
+
+@functools.lru_cache(maxsize=None)
+def _char_width(char, font):
+    """Width of a single character at 1pt."""
+    return pdfmetrics.stringWidth(char, font, 1)
+
+
+@functools.lru_cache(maxsize=512)
+def _string_width(text, font, size):
+    """
+    Width of a string in points. All card text is fixed, so cache it.
+
+    ReportLab applies no kerning, so the width is just the sum of the
+    character widths, which are shared by all strings in the same font.
+    """
+    return sum(_char_width(char, font) for char in text) * size
+
+
+def _draw_centred(c, x, y, text, font, size):
+    """
+    Draw text centred on x in the given font, using the cached width.
+
+    Unlike drawString/drawCentredString, a bare text object does not
+    measure the string again on every call.
+    """
+    c.setFont(font, size)
+    t = c.beginText(x - _string_width(text, font, size) / 2, y)
+    t.textOut(text)
+    c.drawText(t)
+
 
 # =============================================================================
 # DRAWING FUNCTIONS - Crop Marks
 # =============================================================================
 
-def draw_crop_marks(c, x, y, width, height):
+@functools.lru_cache(maxsize=None)
+def _crop_deltas(width, height):
     """
-    Draw crop marks at all four corners of a card.
+    Crop mark segments of one card relative to its bottom-left cut corner:
+    2 per corner, as (x1, y1, x2, y2).
+    """
+    return (
+        # Top-left corner
+        (-CROP_REACH, height, -CROP_OFFSET, height),
+        (0, height + CROP_OFFSET, 0, height + CROP_REACH),
+        # Top-right corner
+        (width + CROP_OFFSET, height, width + CROP_REACH, height),
+        (width, height + CROP_OFFSET, width, height + CROP_REACH),
+        # Bottom-left corner
+        (-CROP_REACH, 0, -CROP_OFFSET, 0),
+        (0, -CROP_REACH, 0, -CROP_OFFSET),
+        # Bottom-right corner
+        (width + CROP_OFFSET, 0, width + CROP_REACH, 0),
+        (width, -CROP_REACH, width, -CROP_OFFSET),
+    )
+
+
+def compute_page_crop_segments(cut_rects):
+    """
+    Compute the crop mark line segments for all cards of a page.
+
+    Args:
+        cut_rects: (x, y, width, height) of each card's cut line
+
+    Returns:
+        List of (x1, y1, x2, y2) segments, 2 per corner and 8 per card
+    """
+    return [
+        (x + x1, y + y1, x + x2, y + y2)
+        for x, y, width, height in cut_rects
+        for x1, y1, x2, y2 in _crop_deltas(width, height)
+    ]
+
+
+def draw_crop_marks(c, positions):
+    """
+    Draw the crop marks of all cards on a page as one stroked path.
+
+    Called once per page after the cards, so the marks lie on top of
+    every card's bleed.
 
     Args:
         c: Canvas object
-        x, y: Bottom-left corner of card (including bleed)
-        width, height: Card dimensions (including bleed)
+        positions: Cut line position (x, y) of each card (not bleed)
     """
     c.saveState()
     c.setStrokeColor(Colors.crop_mark)
     c.setLineWidth(CROP_LINE_WIDTH)
-
-    # Calculate cut line positions (inside bleed)
-    cut_left = x + BLEED
-    cut_right = x + width - BLEED
-    cut_bottom = y + BLEED
-    cut_top = y + height - BLEED
-
-    # Top-left corner
-    c.line(cut_left - CROP_OFFSET - CROP_LENGTH, cut_top,
-           cut_left - CROP_OFFSET, cut_top)
-    c.line(cut_left, cut_top + CROP_OFFSET,
-           cut_left, cut_top + CROP_OFFSET + CROP_LENGTH)
-
-    # Top-right corner
-    c.line(cut_right + CROP_OFFSET, cut_top,
-           cut_right + CROP_OFFSET + CROP_LENGTH, cut_top)
-    c.line(cut_right, cut_top + CROP_OFFSET,
-           cut_right, cut_top + CROP_OFFSET + CROP_LENGTH)
-
-    # Bottom-left corner
-    c.line(cut_left - CROP_OFFSET - CROP_LENGTH, cut_bottom,
-           cut_left - CROP_OFFSET, cut_bottom)
-    c.line(cut_left, cut_bottom - CROP_OFFSET - CROP_LENGTH,
-           cut_left, cut_bottom - CROP_OFFSET)
-
-    # Bottom-right corner
-    c.line(cut_right + CROP_OFFSET, cut_bottom,
-           cut_right + CROP_OFFSET + CROP_LENGTH, cut_bottom)
-    c.line(cut_right, cut_bottom - CROP_OFFSET - CROP_LENGTH,
-           cut_right, cut_bottom - CROP_OFFSET)
-
+    c.lines(compute_page_crop_segments(
+        [(x, y, CARD_WIDTH, CARD_HEIGHT) for x, y in positions]))
     c.restoreState()
 
 
@@ -581,125 +480,155 @@ def draw_crop_marks(c, x, y, width, height):
 # DRAWING FUNCTIONS - Background
 # =============================================================================
 
-def draw_front_background(c, x, y):
+# Wave paths are built once, relative to the card's cut corner (0, 0).
+# PDFPathObject is not tied to a canvas, so the same objects are reused
+# for every PDF.
+
+def _wave_path(geometry):
     """
-    Draw the front side background with wave design and accent circle.
+    Build a filled wave from the left to the right bleed edge, closed along
+    the bottom bleed edge. geometry is one of the *_WAVE_* tuples.
+    """
+    start_y, c1x, c1y, c2x, c2y, end_y = geometry
+    left = -BLEED
+    right = CARD_WIDTH + BLEED
+    bottom = -BLEED
+
+    path = PDFPathObject()
+    path.moveTo(left, start_y)
+    path.curveTo(c1x, c1y, c2x, c2y, right, end_y)
+    path.lineTo(right, bottom)
+    path.lineTo(left, bottom)
+    path.close()
+    return path
 
-    Layers (back to front):
-        1. White base
-        2. Back wave (light gray)
-        3. Front wave (darker gray)
-        4. Accent circle (pink, on top of waves)
-        5. Red accent bar at top
 
-    Args:
-        x, y: Cut line position (not bleed)
+def _circle_path(x, y, r):
+    """Build a filled-circle path (four Béziers) in card coordinates."""
+    path = PDFPathObject()
+    path.circle(x, y, r)
+    return path
+
+
+# (back, front) waves of the front side; the two darker waves of the red shell
+_FRONT_WAVES = (_wave_path(FRONT_WAVE_BACK), _wave_path(FRONT_WAVE_FRONT))
+_BACK_WAVES = (_wave_path(BACK_WAVE_1), _wave_path(BACK_WAVE_2))
+_FRONT_CIRCLE = _circle_path(FRONT_CIRCLE_X, FRONT_CIRCLE_Y, FRONT_CIRCLE_R)
+_BACK_CIRCLE = _circle_path(BACK_CIRCLE_X, BACK_CIRCLE_Y, BACK_CIRCLE_R)
+
+
+# Form XObject bounding box of a card including bleed, origin at the cut corner
+CARD_FORM_BBOX = (-BLEED, -BLEED, CARD_WIDTH + BLEED, CARD_HEIGHT + BLEED)
+
+
+def _draw_form(c, x, y, name, draw, bbox=CARD_FORM_BBOX):
     """
-    # Drawing area with bleed
-    draw_x = x - BLEED
-    draw_y = y - BLEED
-    draw_width = CARD_WIDTH + 2 * BLEED
-    draw_height = CARD_HEIGHT + 2 * BLEED
+    Stamp a named Form XObject with its origin at (x, y).
 
-    # Layer 1: White base
-    c.setFillColor(Colors.bg)
-    c.rect(draw_x, draw_y, draw_width, draw_height, fill=1, stroke=0)
+    The form is recorded by draw(c), in coordinates relative to that origin,
+    the first time it is used in a PDF. Every later use only references it,
+    so the geometry is stored once per file.
+    """
+    if not c.hasForm(name):
+        c.beginForm(name, *bbox)
+        draw(c)
+        c.endForm()
 
-    # Layer 2: Back wave (lighter, higher)
     c.saveState()
-    path_back = c.beginPath()
-    path_back.moveTo(draw_x, y + 25*mm)
-    path_back.curveTo(
-        x + 20*mm, y + 35*mm,
-        x + 35*mm, y + 50*mm,
-        draw_x + draw_width, y + 60*mm
-    )
-    path_back.lineTo(draw_x + draw_width, draw_y)
-    path_back.lineTo(draw_x, draw_y)
-    path_back.close()
-    c.setFillColor(Colors.shape_light)
-    c.drawPath(path_back, fill=1, stroke=0)
+    c.translate(x, y)
+    c.doForm(name)
     c.restoreState()
 
-    # Layer 3: Front wave (darker, lower)
-    c.saveState()
-    path_front = c.beginPath()
-    path_front.moveTo(draw_x, y + 15*mm)
-    path_front.curveTo(
-        x + 25*mm, y + 22*mm,
-        x + 40*mm, y + 35*mm,
-        draw_x + draw_width, y + 45*mm
-    )
-    path_front.lineTo(draw_x + draw_width, draw_y)
-    path_front.lineTo(draw_x, draw_y)
-    path_front.close()
+
+def _draw_plain_shell(c):
+    """
+    Draw the white base with the red accent bar at the top, shared by the
+    front side and the title card back. Drawn at the origin.
+    """
+    c.setFillColor(Colors.bg)
+    c.rect(-BLEED, -BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED, fill=1, stroke=0)
+
+    c.setFillColor(Colors.accent)
+    c.rect(-BLEED, ACCENT_BAR_Y, CARD_WIDTH_BLEED, ACCENT_BAR_HEIGHT + BLEED, fill=1, stroke=0)
+
+
+def _draw_front_shell(c):
+    """
+    Draw the front side decoration at the origin (see draw_front_background).
+    """
+    # Layer 1: White base and red accent bar at top (the waves stay below it)
+    _draw_plain_shell(c)
+
+    # Layers 2+3: Back wave (lighter, higher) and front wave (darker, lower)
+    path_back, path_front = _FRONT_WAVES
+    c.setFillColor(Colors.shape_light)
+    c.drawPath(path_back, fill=1, stroke=0)
     c.setFillColor(Colors.shape_medium)
     c.drawPath(path_front, fill=1, stroke=0)
-    c.restoreState()
 
     # Layer 4: Accent circle (on top of waves)
-    c.saveState()
     c.setFillColor(Colors.shape_accent)
-    c.circle(x + 50*mm, y + 20*mm, 12*mm, fill=1, stroke=0)
-    c.restoreState()
-
-    # Layer 5: Red accent bar at top
-    c.setFillColor(Colors.accent)
-    c.rect(draw_x, y + CARD_HEIGHT - 3.5*mm, draw_width, 3.5*mm + BLEED, fill=1, stroke=0)
+    c.drawPath(_FRONT_CIRCLE, fill=1, stroke=0)
 
 
-def draw_back_background(c, x, y, content):
+def _draw_red_card_shell(c):
     """
-    Draw the decorative back side (4-card edition only).
+    Draw the red wave design shared by the back side and the title card.
 
-    Red-themed design with waves and KABUL branding.
+    Layers (back to front): red base, two darker waves, accent circle.
+    Drawn at the origin; placed via the "red_shell" form.
     """
-    draw_x = x - BLEED
-    draw_y = y - BLEED
-    draw_width = CARD_WIDTH + 2 * BLEED
-    draw_height = CARD_HEIGHT + 2 * BLEED
-
     # Base color
     c.setFillColor(Colors.back_base)
-    c.rect(draw_x, draw_y, draw_width, draw_height, fill=1, stroke=0)
+    c.rect(-BLEED, -BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED, fill=1, stroke=0)
 
-    # Wave 1 (darker)
-    c.saveState()
-    path = c.beginPath()
-    path.moveTo(draw_x, y + 30*mm)
-    path.curveTo(x + 20*mm, y + 40*mm, x + 40*mm, y + 55*mm, draw_x + draw_width, y + 65*mm)
-    path.lineTo(draw_x + draw_width, draw_y)
-    path.lineTo(draw_x, draw_y)
-    path.close()
+    # Wave 1 (darker) and wave 2 (darkest)
+    path, path2 = _BACK_WAVES
     c.setFillColor(Colors.back_wave1)
     c.drawPath(path, fill=1, stroke=0)
-    c.restoreState()
-
-    # Wave 2 (darkest)
-    c.saveState()
-    path2 = c.beginPath()
-    path2.moveTo(draw_x, y + 18*mm)
-    path2.curveTo(x + 25*mm, y + 25*mm, x + 45*mm, y + 38*mm, draw_x + draw_width, y + 48*mm)
-    path2.lineTo(draw_x + draw_width, draw_y)
-    path2.lineTo(draw_x, draw_y)
-    path2.close()
     c.setFillColor(Colors.back_wave2)
     c.drawPath(path2, fill=1, stroke=0)
-    c.restoreState()
 
     # Accent circle
-    c.saveState()
     c.setFillColor(Colors.back_circle)
-    c.circle(x + 50*mm, y + 22*mm, 10*mm, fill=1, stroke=0)
-    c.restoreState()
+    c.drawPath(_BACK_CIRCLE, fill=1, stroke=0)
+
+
+def draw_front_background(c, x, y):
+    """
+    Draw the front side background with wave design and accent circle.
+
+    Layers (back to front):
+        1. White base
+        2. Back wave (light gray)
+        3. Front wave (darker gray)
+        4. Accent circle (pink, on top of waves)
+        5. Red accent bar at top
+
+    Args:
+        x, y: Cut line position (not bleed)
+    """
+    _draw_form(c, x, y, "front_shell", _draw_front_shell)
+
+
+def _draw_red_background(c, x, y, title, title_y, title_size, subtitle, subtitle_y, subtitle_size):
+    """Draw the red card shell with a centred title and subtitle."""
+    _draw_form(c, x, y, "red_shell", _draw_red_card_shell)
 
-    # KABUL text
     c.setFillColor(Colors.bg)
-    c.setFont(Fonts.title, 18)
-    c.drawCentredString(x + CARD_WIDTH/2, y + CARD_HEIGHT/2 + 5*mm, content["BACK_TITLE"])
+    _draw_centred(c, x + CARD_HALF_W, y + title_y, title, Fonts.title, title_size)
+    _draw_centred(c, x + CARD_HALF_W, y + subtitle_y, subtitle, Fonts.body, subtitle_size)
 
-    c.setFont(Fonts.body, 8)
-    c.drawCentredString(x + CARD_WIDTH/2, y + CARD_HEIGHT/2 - 5*mm, content["BACK_SUBTITLE"])
+
+def draw_back_background(c, x, y, content):
+    """
+    Draw the decorative back side (4-card edition only).
+
+    Red-themed design with waves and KABUL branding.
+    """
+    _draw_red_background(c, x, y,
+                         content["BACK_TITLE"], BACK_TITLE_Y, 18,
+                         content["BACK_SUBTITLE"], BACK_SUBTITLE_Y, 8)
 
 
 def draw_title_card_background(c, x, y, content):
@@ -708,66 +637,102 @@ def draw_title_card_background(c, x, y, content):
 
     This card can be used as a cover card for the rule set.
     """
-    draw_x = x - BLEED
-    draw_y = y - BLEED
-    draw_width = CARD_WIDTH + 2 * BLEED
-    draw_height = CARD_HEIGHT + 2 * BLEED
+    _draw_red_background(c, x, y,
+                         content["TITLE_CARD_TITLE"], TITLE_CARD_TITLE_Y, 20,
+                         content["TITLE_CARD_SUBTITLE"], TITLE_CARD_SUBTITLE_Y, 9)
 
-    # Base color
-    c.setFillColor(Colors.back_base)
-    c.rect(draw_x, draw_y, draw_width, draw_height, fill=1, stroke=0)
 
-    # Wave 1 (darker)
-    c.saveState()
-    path = c.beginPath()
-    path.moveTo(draw_x, y + 30*mm)
-    path.curveTo(x + 20*mm, y + 40*mm, x + 40*mm, y + 55*mm, draw_x + draw_width, y + 65*mm)
-    path.lineTo(draw_x + draw_width, draw_y)
-    path.lineTo(draw_x, draw_y)
-    path.close()
-    c.setFillColor(Colors.back_wave1)
-    c.drawPath(path, fill=1, stroke=0)
-    c.restoreState()
+def _clip_to_bleed(c, x, y):
+    """Restrict drawing to the bleed area of the card at (x, y)."""
+    clip_path = c.beginPath()
+    clip_path.rect(x - BLEED, y - BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED)
+    c.clipPath(clip_path, stroke=0, fill=0)
 
-    # Wave 2 (darkest)
-    c.saveState()
-    path2 = c.beginPath()
-    path2.moveTo(draw_x, y + 18*mm)
-    path2.curveTo(x + 25*mm, y + 25*mm, x + 45*mm, y + 38*mm, draw_x + draw_width, y + 48*mm)
-    path2.lineTo(draw_x + draw_width, draw_y)
-    path2.lineTo(draw_x, draw_y)
-    path2.close()
-    c.setFillColor(Colors.back_wave2)
-    c.drawPath(path2, fill=1, stroke=0)
-    c.restoreState()
 
-    # Accent circle
-    c.saveState()
-    c.setFillColor(Colors.back_circle)
-    c.circle(x + 50*mm, y + 22*mm, 10*mm, fill=1, stroke=0)
-    c.restoreState()
+def draw_title_card(c, x, y, content):
+    """Draw the title card (clipped to the bleed if CLIP_TO_BLEED is set)."""
+    if CLIP_TO_BLEED:
+        c.saveState()
+        _clip_to_bleed(c, x, y)
 
-    # KABUL title (larger)
-    c.setFillColor(Colors.bg)
-    c.setFont(Fonts.title, 20)
-    c.drawCentredString(x + CARD_WIDTH/2, y + CARD_HEIGHT/2 + 8*mm, content["TITLE_CARD_TITLE"])
+    draw_title_card_background(c, x, y, content)
 
-    # "Spielregeln" subtitle
-    c.setFont(Fonts.body, 9)
-    c.drawCentredString(x + CARD_WIDTH/2, y + CARD_HEIGHT/2 - 4*mm, content["TITLE_CARD_SUBTITLE"])
+    if CLIP_TO_BLEED:
+        c.restoreState()
 
 
-def draw_title_card(c, x, y, content):
-    """Draw the title card with clipping and crop marks."""
-    c.saveState()
-    clip_path = c.beginPath()
-    clip_path.rect(x - BLEED, y - BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED)
-    c.clipPath(clip_path, stroke=0, fill=0)
+# QR module matrices keyed by URL. Encoding the QR matrix is the most
+# expensive step of the title card, and the URL never changes within a run.
+_QR_CACHE = {}
 
-    draw_title_card_background(c, x, y, content)
+
+def _qr_modules(url):
+    """Return the QR code matrix for url as rows of booleans, top row first."""
+    modules = _QR_CACHE.get(url)
+    if modules is None:
+        # Imported here: reportlab.graphics.barcode takes ~50 ms to import
+        # and only the title card needs it
+        from reportlab.graphics.barcode import qrencoder
+
+        # Level L: what the QrCodeWidget produced, since its barLevel was
+        # only assigned after the encoder had already been created
+        code = qrencoder.QRCode(None, qrencoder.QRErrorCorrectLevel.L)
+        code.addData(url)
+        code.make()
+        modules = [[bool(module) for module in row] for row in code.modules]
+        _QR_CACHE[url] = modules
+    return modules
+
+
+def _qr_image_mask(modules):
+    """
+    Encode a QR matrix as a 1-bit PDF inline image mask, one sample per
+    module, top row first. Dark modules paint the current fill color.
+    """
+    size = len(modules)
+    data = []
+    for row in modules:
+        bits = "".join("1" if dark else "0" for dark in row).ljust(-(-size // 8) * 8, "0")
+        data.append(int(bits, 2).to_bytes(len(bits) // 8, "big").hex())
+    return "BI /W %d /H %d /IM true /D [1 0] /F /AHx ID %s> EI" % (size, size, "".join(data))
+
+
+def _draw_qr_code(c, url):
+    """
+    Draw the QR code for url, QR_SIZE wide including the quiet zone,
+    with its bottom-left corner at the origin.
+
+    The modules are a single 1-bit image mask scaled up to size, which is
+    far smaller than a path with one rect per run of dark modules.
+    """
+    modules = _qr_modules(url)
+    box = QR_SIZE / (len(modules) + 2 * QR_BORDER)
+
+    c.setFillColor(Colors.qr_code)
+    c.saveState()
+    c.translate(QR_BORDER * box, QR_BORDER * box)
+    c.scale(len(modules) * box, len(modules) * box)
+    c.addLiteral(_qr_image_mask(modules))
     c.restoreState()
 
-    draw_crop_marks(c, x - BLEED, y - BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED)
+
+@functools.lru_cache(maxsize=None)
+def _description_layout(lines):
+    """
+    Lay out the game description once per text.
+
+    Returns (dx, dy, line) for each non-empty line, relative to the card's
+    centre line and DESCRIPTION_Y; empty lines only add DESCRIPTION_GAP.
+    """
+    layout = []
+    dy = 0
+    for line in lines:
+        if line == "":
+            dy -= DESCRIPTION_GAP
+        else:
+            layout.append((-_string_width(line, Fonts.body, 6) / 2, dy, line))
+            dy -= DESCRIPTION_LINE
+    return tuple(layout)
 
 
 def draw_title_card_back(c, x, y, content):
@@ -778,68 +743,44 @@ def draw_title_card_back(c, x, y, content):
     - Short game description
     - QR code linking to GitHub repository
     """
-    draw_x = x - BLEED
-    draw_y = y - BLEED
-    draw_width = CARD_WIDTH + 2 * BLEED
-    draw_height = CARD_HEIGHT + 2 * BLEED
+    # White background with red accent bar at top (matching front design)
+    _draw_form(c, x, y, "plain_shell", _draw_plain_shell)
 
-    # White background
-    c.setFillColor(Colors.bg)
-    c.rect(draw_x, draw_y, draw_width, draw_height, fill=1, stroke=0)
-
-    # Red accent bar at top (matching front design)
-    c.setFillColor(Colors.accent)
-    c.rect(draw_x, y + CARD_HEIGHT - 3.5*mm, draw_width, 3.5*mm + BLEED, fill=1, stroke=0)
+    center_x = x + CARD_HALF_W
 
     # Title
-    c.setFont(Fonts.title, 11)
     c.setFillColor(Colors.text)
-    c.drawCentredString(x + CARD_WIDTH/2, y + CARD_HEIGHT - 12*mm, content["ABOUT_TITLE"])
+    _draw_centred(c, center_x, y + ABOUT_TITLE_Y, content["ABOUT_TITLE"], Fonts.title, 11)
 
-    # Game description
+    # Game description (one text object, layout computed once per text)
     c.setFont(Fonts.body, 6)
-    c.setFillColor(Colors.text)
+    description = c.beginText()
+    for dx, dy, line in _description_layout(tuple(content["GAME_DESCRIPTION"])):
+        description.setTextOrigin(center_x + dx, y + DESCRIPTION_Y + dy)
+        description.textOut(line)
+    c.drawText(description)
 
-    text_y = y + CARD_HEIGHT - 20*mm
-    for line in content["GAME_DESCRIPTION"]:
-        if line == "":
-            text_y -= 2*mm
-        else:
-            c.drawCentredString(x + CARD_WIDTH/2, text_y, line)
-            text_y -= 3.2*mm
-
-    # QR Code
-    qr_size = 18 * mm
-    qr_code = qr.QrCodeWidget(content["GITHUB_URL"])
-    qr_code.barLevel = 'M'
-    qr_code.barWidth = qr_size
-    qr_code.barHeight = qr_size
-
-    # Create drawing and render QR code
-    d = Drawing(qr_size, qr_size)
-    d.add(qr_code)
-
-    qr_x = x + (CARD_WIDTH - qr_size) / 2
-    qr_y = y + 12*mm
-    renderPDF.draw(d, c, qr_x, qr_y)
+    # QR Code (encoded once per URL, stored once per PDF as a form)
+    _draw_form(c, x + QR_X, y + QR_Y, "qr_code",
+               functools.partial(_draw_qr_code, url=content["GITHUB_URL"]),
+               bbox=(0, 0, QR_SIZE, QR_SIZE))
 
     # URL label below QR code
-    c.setFont(Fonts.body, 4.5)
     c.setFillColor(Colors.heading)
-    c.drawCentredString(x + CARD_WIDTH/2, y + 8*mm, "github.com/hazelwalker/kabul-instructions")
+    _draw_centred(c, center_x, y + QR_LABEL_Y, "github.com/hazelwalker/kabul-instructions",
+                  Fonts.body, 4.5)
 
 
 def draw_title_card_back_with_marks(c, x, y, content):
-    """Draw title card back with clipping and crop marks."""
-    c.saveState()
-    clip_path = c.beginPath()
-    clip_path.rect(x - BLEED, y - BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED)
-    c.clipPath(clip_path, stroke=0, fill=0)
+    """Draw title card back (clipped to the bleed if CLIP_TO_BLEED is set)."""
+    if CLIP_TO_BLEED:
+        c.saveState()
+        _clip_to_bleed(c, x, y)
 
     draw_title_card_back(c, x, y, content)
-    c.restoreState()
 
-    draw_crop_marks(c, x - BLEED, y - BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED)
+    if CLIP_TO_BLEED:
+        c.restoreState()
 
 
 # =============================================================================
@@ -849,167 +790,186 @@ def draw_title_card_back_with_marks(c, x, y, content):
 def draw_title(c, x, y, title, number):
     """Draw card title and number."""
     # Main title
-    c.setFont(Fonts.title, Fonts.title_size)
     c.setFillColor(Colors.text)
-    c.drawCentredString(x + CARD_WIDTH/2, y + CARD_HEIGHT - 11*mm, "KABUL")
+    _draw_centred(c, x + CARD_HALF_W, y + TITLE_Y, "KABUL", Fonts.title, Fonts.title_size)
 
     # Subtitle
-    c.setFont(Fonts.body, Fonts.subtitle_size)
     c.setFillColor(Colors.heading)
-    c.drawCentredString(x + CARD_WIDTH/2, y + CARD_HEIGHT - 16.5*mm, title)
+    _draw_centred(c, x + CARD_HALF_W, y + SUBTITLE_Y, title, Fonts.body, Fonts.subtitle_size)
 
     # Card number (bottom right)
     c.setFont(Fonts.body, Fonts.number_size)
     c.setFillColor(Colors.accent)
-    c.drawRightString(x + CARD_WIDTH - MARGIN - 0.5*mm, y + MARGIN + 1*mm, number)
-
+    t = c.beginText(x + NUMBER_X - _string_width(number, Fonts.body, Fonts.number_size),
+                    y + NUMBER_Y)
+    t.textOut(number)
+    c.drawText(t)
 
-def draw_values_table(c, x, y, card_data):
-    """Draw card values with aligned columns (for Card 1)."""
-    content_y = y + CARD_HEIGHT - 21*mm
 
-    # Column positions
-    col_label = x + MARGIN + 1*mm
-    col_equals = x + 24*mm
-    col_value = x + 27*mm
+def _values_table_fragments(card_data, fragments):
+    """Collect the card values with aligned columns (for Card 1)."""
+    content_y = CONTENT_Y
 
-    c.setFont(Fonts.body, Fonts.body_size)
+    body = (Fonts.body, Fonts.body_size, Colors.text)
+    action_style = (Fonts.body, Fonts.body_size, Colors.heading)
 
-    for label, value, action, has_red in card_data["values"]:
+    for label, value, action_display, has_red in card_data["values"]:
         # Handle card symbols with colors
         if "♠♣" in label:
-            parts_before = label.split("♠♣")[0]
-            c.setFillColor(Colors.text)
-            c.drawString(col_label, content_y, parts_before)
-            symbol_x = col_label + c.stringWidth(parts_before, Fonts.body, Fonts.body_size)
-            c.setFillColor(Colors.black)
-            c.drawString(symbol_x, content_y, "♠♣")
+            symbols, symbol_color = "♠♣", Colors.black
         elif "♥♦" in label:
-            parts_before = label.split("♥♦")[0]
-            c.setFillColor(Colors.text)
-            c.drawString(col_label, content_y, parts_before)
-            symbol_x = col_label + c.stringWidth(parts_before, Fonts.body, Fonts.body_size)
-            c.setFillColor(Colors.red)
-            c.drawString(symbol_x, content_y, "♥♦")
+            symbols, symbol_color = "♥♦", Colors.red
         else:
-            c.setFillColor(Colors.text)
-            c.drawString(col_label, content_y, label)
+            symbols = None
+
+        if symbols:
+            parts_before = label.split(symbols)[0]
+            fragments[body].append((TEXT_X, content_y, parts_before))
+            symbol_x = TEXT_X + _string_width(parts_before, Fonts.body, Fonts.body_size)
+            fragments[(Fonts.body, Fonts.body_size, symbol_color)].append(
+                (symbol_x, content_y, symbols))
+        else:
+            fragments[body].append((TEXT_X, content_y, label))
 
         # Aligned "=" and value
-        c.setFillColor(Colors.text)
-        c.drawString(col_equals, content_y, "=")
-        c.drawString(col_value, content_y, value)
+        fragments[body].append((EQUALS_X, content_y, "="))
+        fragments[body].append((VALUE_X, content_y, value))
 
         # Action (indented, next line)
-        if action:
-            content_y -= 2.8*mm
-            c.setFillColor(Colors.heading)
-            c.drawString(col_value, content_y, f"→ {action}")
-            c.setFillColor(Colors.text)
+        if action_display:
+            content_y -= ACTION_LINE
+            fragments[action_style].append((VALUE_X, content_y, action_display))
 
-        content_y -= 3.2*mm
+        content_y -= VALUE_LINE
 
     # Footer sections
-    content_y -= 1.5*mm
+    heading = (Fonts.heading, Fonts.heading_size, Colors.heading)
+    content_y -= FOOTER_GAP
     for footer in card_data["footer_sections"]:
-        c.setFont(Fonts.heading, Fonts.heading_size)
-        c.setFillColor(Colors.heading)
-        c.drawString(col_label, content_y, footer["heading"])
+        fragments[heading].append((TEXT_X, content_y, footer["heading"]))
+
+        heading_width = _string_width(footer["heading"] + "  ", Fonts.heading, Fonts.heading_size)
+        fragments[body].append((TEXT_X + heading_width, content_y, footer["content"]))
+        content_y -= FOOTER_LINE
 
-        c.setFont(Fonts.body, Fonts.body_size)
-        c.setFillColor(Colors.text)
-        heading_width = c.stringWidth(footer["heading"] + "  ", Fonts.heading, Fonts.heading_size)
-        c.drawString(col_label + heading_width, content_y, footer["content"])
-        content_y -= 3.5*mm
 
+def _sections_fragments(card_data, fragments):
+    """Collect content sections with headings (for Cards 2-4)."""
+    content_y = CONTENT_Y
 
-def draw_sections(c, x, y, card_data):
-    """Draw content sections with headings (for Cards 2-4)."""
-    content_y = y + CARD_HEIGHT - 21*mm
+    heading = (Fonts.heading, Fonts.heading_size, Colors.heading)
+    body = (Fonts.body, Fonts.body_size, Colors.text)
+    arrow = (Fonts.body, Fonts.body_size, Colors.accent)
 
     for section in card_data["sections"]:
         # Section heading (bold)
-        c.setFont(Fonts.heading, Fonts.heading_size)
-        c.setFillColor(Colors.heading)
-        c.drawString(x + MARGIN + 1*mm, content_y, section["heading"])
-        content_y -= 3.3*mm
+        fragments[heading].append((TEXT_X, content_y, section.heading))
+        content_y -= HEADING_LINE
 
         # Section content
-        c.setFont(Fonts.body, Fonts.body_size)
-        c.setFillColor(Colors.text)
-
-        for line in section["content"]:
-            indent = 0
-            if line.startswith("   "):
-                indent = 2.5*mm
-                line = line.strip()
+        for line in section.lines:
+            text_x = TEXT_X + INDENT if line.indent else TEXT_X
 
             # Style arrows in accent color
-            if line.startswith("→"):
-                c.setFillColor(Colors.accent)
-                c.drawString(x + MARGIN + 1*mm + indent, content_y, "→")
-                c.setFillColor(Colors.text)
-                c.drawString(x + MARGIN + 1*mm + indent + 3*mm, content_y, line[2:])
+            if line.is_arrow:
+                fragments[arrow].append((text_x, content_y, "→"))
+                fragments[body].append((text_x + ARROW_GAP, content_y, line.text))
             else:
-                c.drawString(x + MARGIN + 1*mm + indent, content_y, line)
+                fragments[body].append((text_x, content_y, line.text))
+
+            content_y -= SECTION_LINE
 
-            content_y -= 2.9*mm
+        content_y -= SECTION_GAP
 
-        content_y -= 1.2*mm
+
+def collect_fragments(card_data):
+    """
+    Lay out the body text of a front card without drawing it.
+
+    Returns:
+        Dict mapping (font, size, color) to a list of (x, y, text)
+        fragments, positioned relative to the card's cut corner
+    """
+    fragments = collections.defaultdict(list)
+    if card_data["type"] == "values_table":
+        _values_table_fragments(card_data, fragments)
+    else:
+        _sections_fragments(card_data, fragments)
+    return fragments
+
+
+def draw_fragments(c, x, y, fragments):
+    """
+    Draw collected text fragments for the card at (x, y).
+
+    Font and color are set once per group, and each group is emitted as a
+    single text object. Fragments after the first are placed with short
+    relative moves (Td) instead of a full text matrix (Tm) each.
+    """
+    for (font, size, color), group in fragments.items():
+        c.setFont(font, size)
+        c.setFillColor(color)
+        last_x, last_y, text = group[0]
+        t = c.beginText(x + last_x, y + last_y)
+        t.textOut(text)
+        for fragment_x, fragment_y, text in group[1:]:
+            t.moveCursor(fragment_x - last_x, last_y - fragment_y)
+            t.textOut(text)
+            last_x, last_y = fragment_x, fragment_y
+        c.drawText(t)
 
 
 def draw_card_front(c, x, y, card_data, number):
     """Draw a complete front side card."""
-    # Clip to bleed area
-    c.saveState()
-    clip_path = c.beginPath()
-    clip_path.rect(x - BLEED, y - BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED)
-    c.clipPath(clip_path, stroke=0, fill=0)
-
     # Background
+    if CLIP_TO_BLEED:
+        c.saveState()
+        _clip_to_bleed(c, x, y)
+
     draw_front_background(c, x, y)
-    c.restoreState()
+
+    if CLIP_TO_BLEED:
+        c.restoreState()
 
     # Title
     draw_title(c, x, y, card_data["title"], number)
 
     # Content
-    if card_data["type"] == "values_table":
-        draw_values_table(c, x, y, card_data)
-    else:
-        draw_sections(c, x, y, card_data)
-
-    # Crop marks
-    draw_crop_marks(c, x - BLEED, y - BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED)
+    draw_fragments(c, x, y, collect_fragments(card_data))
 
 
 def draw_card_back(c, x, y, content):
     """Draw a decorative back side card (4-card edition)."""
-    c.saveState()
-    clip_path = c.beginPath()
-    clip_path.rect(x - BLEED, y - BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED)
-    c.clipPath(clip_path, stroke=0, fill=0)
+    if CLIP_TO_BLEED:
+        c.saveState()
+        _clip_to_bleed(c, x, y)
 
     draw_back_background(c, x, y, content)
-    c.restoreState()
 
-    draw_crop_marks(c, x - BLEED, y - BLEED, CARD_WIDTH_BLEED, CARD_HEIGHT_BLEED)
+    if CLIP_TO_BLEED:
+        c.restoreState()
 
 
 # =============================================================================
 # PAGE LAYOUT
 # =============================================================================
 
-def draw_page_info(c, page_num, total_pages, description, edition):
-    """Draw page information footer."""
+def draw_page_info(c, page_num, total_pages, description, edition, duplex_hint=None):
+    """
+    Draw the page information footer, plus the duplex hint at the right
+    if given. Both are emitted as one text object.
+    """
     c.setFont(Fonts.body, 7)
-    c.setFillColor(HexColor("#999999"))
-
-    info = f"KABUL {edition} | Seite {page_num}/{total_pages} | {description} | 63×88mm"
-    c.drawString(15*mm, 10*mm, info)
+    c.setFillColor(Colors.page_info)
 
-    if page_num == 2:
-        c.drawRightString(PAGE_WIDTH - 15*mm, 10*mm, "↻ Duplex: Lange Kante spiegeln")
+    t = c.beginText(PAGE_INFO_X, PAGE_INFO_Y)
+    t.textOut(PAGE_INFO_FORMAT.format(edition=edition, page=page_num, total=total_pages,
+                                      description=description))
+    if duplex_hint:
+        t.setTextOrigin(PAGE_WIDTH - PAGE_INFO_X - _string_width(duplex_hint, Fonts.body, 7),
+                        PAGE_INFO_Y)
+        t.textOut(duplex_hint)
+    c.drawText(t)
 
 
 def calculate_4card_positions():
@@ -1058,20 +1018,45 @@ def calculate_2card_positions():
     return front, back
 
 
+# The layouts only depend on page and card constants, so they are computed
+# once at import: (front, back) cut positions of each edition.
+POSITIONS_4CARD = calculate_4card_positions()
+POSITIONS_2CARD = calculate_2card_positions()
+
+
+# =============================================================================
+# PDF GENERATION
+# =============================================================================
+
+def _new_canvas(buffer):
+    """Create an A4 canvas that renders one PDF into buffer."""
+    return StatefulCanvas(buffer, pagesize=A4, pageCompression=PAGE_COMPRESSION)
+
+
+def _save_pdf(c, buffer, output_path):
+    """
+    Finish the PDF in memory, then write it to output_path in one go.
+
+    The file is only opened once the PDF is complete, so a failing run
+    never leaves a truncated PDF behind.
+    """
+    c.save()
+    with open(output_path, "wb") as f:
+        f.write(buffer.getvalue())
+
+
 # =============================================================================
 # PDF GENERATION - 4-Card Edition
 # =============================================================================
 
-def generate_4card_edition(output_path):
+def draw_4card_edition(c, content):
     """
-    Generate the 4-card edition with decorative back sides.
+    Draw the 4-card edition with decorative back sides.
 
     Page 1: Front sides (Cards 1-4)
     Page 2: Back sides (mirrored for duplex)
     """
-    content = get_content()
-    c = canvas.Canvas(output_path, pagesize=A4)
-    front_pos, back_pos = calculate_4card_positions()
+    front_pos, back_pos = POSITIONS_4CARD
 
     cards = [
         (content["CARD_1"], "1/4"),
@@ -1083,35 +1068,37 @@ def generate_4card_edition(output_path):
     # Page 1: Front sides
     for i, (card_data, number) in enumerate(cards):
         draw_card_front(c, front_pos[i][0], front_pos[i][1], card_data, number)
+    draw_crop_marks(c, front_pos)
 
     page_info = content["PAGE_INFO"]
-    c.setFont(Fonts.body, 7)
-    c.setFillColor(HexColor("#999999"))
-    info = f"KABUL {page_info['4card_edition']} | Page 1/2 | {page_info['4card_front']} | 63×88mm"
-    c.drawString(15*mm, 10*mm, info)
+    draw_page_info(c, 1, 2, page_info['4card_front'], page_info['4card_edition'])
     c.showPage()
 
     # Page 2: Back sides (decorative)
     for i in range(4):
         draw_card_back(c, back_pos[i][0], back_pos[i][1], content)
+    draw_crop_marks(c, back_pos)
+
+    draw_page_info(c, 2, 2, page_info['4card_back'], page_info['4card_edition'],
+                   page_info['duplex_hint'])
+    c.showPage()
 
-    c.setFont(Fonts.body, 7)
-    c.setFillColor(HexColor("#999999"))
-    info = f"KABUL {page_info['4card_edition']} | Page 2/2 | {page_info['4card_back']} | 63×88mm"
-    c.drawString(15*mm, 10*mm, info)
-    c.drawRightString(PAGE_WIDTH - 15*mm, 10*mm, page_info['duplex_hint'])
-    c.save()
 
-    print(f"✓ 4-Card Edition ({LANGUAGE.upper()}): {output_path}")
+def generate_4card_edition(output_path, content=None):
+    """Generate the 4-card edition PDF (content defaults to get_content())."""
+    buffer = io.BytesIO()
+    c = _new_canvas(buffer)
+    draw_4card_edition(c, content or get_content())
+    _save_pdf(c, buffer, output_path)
 
 
 # =============================================================================
 # PDF GENERATION - 2-Card Compact Edition
 # =============================================================================
 
-def generate_2card_edition(output_path):
+def draw_2card_edition(c, content):
     """
-    Generate the compact 2-card edition with rules on both sides.
+    Draw the compact 2-card edition with rules on both sides.
 
     Card 1: Kartenwerte (front) / Spielablauf (back)
     Card 2: Detailregeln (front) / Strafen (back)
@@ -1119,51 +1106,48 @@ def generate_2card_edition(output_path):
     Page 1: Front sides
     Page 2: Back sides (mirrored for duplex)
     """
-    content = get_content()
-    c = canvas.Canvas(output_path, pagesize=A4)
-    front_pos, back_pos = calculate_2card_positions()
+    front_pos, back_pos = POSITIONS_2CARD
 
     # Page 1: Front sides
     draw_card_front(c, front_pos[0][0], front_pos[0][1], content["CARD_1"], "1a")
     draw_card_front(c, front_pos[1][0], front_pos[1][1], content["CARD_3"], "2a")
+    draw_crop_marks(c, front_pos)
 
     page_info = content["PAGE_INFO"]
-    c.setFont(Fonts.body, 7)
-    c.setFillColor(HexColor("#999999"))
-    info = f"KABUL {page_info['2card_edition']} | Page 1/2 | {page_info['2card_front']} | 63×88mm"
-    c.drawString(15*mm, 10*mm, info)
+    draw_page_info(c, 1, 2, page_info['2card_front'], page_info['2card_edition'])
     c.showPage()
 
     # Page 2: Back sides (mirrored)
     draw_card_front(c, back_pos[0][0], back_pos[0][1], content["CARD_2"], "1b")
     draw_card_front(c, back_pos[1][0], back_pos[1][1], content["CARD_4"], "2b")
+    draw_crop_marks(c, back_pos)
 
-    c.setFont(Fonts.body, 7)
-    c.setFillColor(HexColor("#999999"))
-    info = f"KABUL {page_info['2card_edition']} | Page 2/2 | {page_info['2card_back']} | 63×88mm"
-    c.drawString(15*mm, 10*mm, info)
-    c.drawRightString(PAGE_WIDTH - 15*mm, 10*mm, page_info['duplex_hint'])
-    c.save()
+    draw_page_info(c, 2, 2, page_info['2card_back'], page_info['2card_edition'],
+                   page_info['duplex_hint'])
+    c.showPage()
 
-    print(f"✓ 2-Card Edition ({LANGUAGE.upper()}): {output_path}")
+
+def generate_2card_edition(output_path, content=None):
+    """Generate the compact 2-card edition PDF (content defaults to get_content())."""
+    buffer = io.BytesIO()
+    c = _new_canvas(buffer)
+    draw_2card_edition(c, content or get_content())
+    _save_pdf(c, buffer, output_path)
 
 
 # =============================================================================
 # PDF GENERATION - Title Card
 # =============================================================================
 
-def generate_title_card(output_path):
+def draw_title_card_edition(c, content):
     """
-    Generate title card PDF with front and back side.
+    Draw the title card with front and back side.
 
     Front: Red design with "KABUL - Spielregeln"
     Back: Game description + QR code to GitHub repo
 
     Optimized for duplex printing (long-edge flip).
     """
-    content = get_content()
-    c = canvas.Canvas(output_path, pagesize=A4)
-
     # Center single card on page
     x = (PAGE_WIDTH - CARD_WIDTH) / 2
     y = (PAGE_HEIGHT - CARD_HEIGHT) / 2
@@ -1172,43 +1156,112 @@ def generate_title_card(output_path):
 
     # Page 1: Front (title)
     draw_title_card(c, x, y, content)
+    draw_crop_marks(c, [(x, y)])
 
-    c.setFont(Fonts.body, 7)
-    c.setFillColor(HexColor("#999999"))
-    c.drawString(15*mm, 10*mm, f"KABUL Title Card | Page 1/2 | {page_info['title_front']} | 63×88mm")
+    draw_page_info(c, 1, 2, page_info['title_front'], "Title Card")
     c.showPage()
 
     # Page 2: Back (description + QR)
     draw_title_card_back_with_marks(c, x, y, content)
+    draw_crop_marks(c, [(x, y)])
 
-    c.setFont(Fonts.body, 7)
-    c.setFillColor(HexColor("#999999"))
-    c.drawString(15*mm, 10*mm, f"KABUL Title Card | Page 2/2 | {page_info['title_back']} | 63×88mm")
-    c.drawRightString(PAGE_WIDTH - 15*mm, 10*mm, page_info['duplex_hint'])
+    draw_page_info(c, 2, 2, page_info['title_back'], "Title Card", page_info['duplex_hint'])
+    c.showPage()
 
-    c.save()
 
-    print(f"✓ Title Card ({LANGUAGE.upper()}): {output_path}")
+def generate_title_card(output_path, content=None):
+    """Generate the title card PDF (content defaults to get_content())."""
+    buffer = io.BytesIO()
+    c = _new_canvas(buffer)
+    draw_title_card_edition(c, content or get_content())
+    _save_pdf(c, buffer, output_path)
+
+
+# =============================================================================
+# PDF GENERATION - All Editions
+# =============================================================================
+
+def generate_all(output_path, content=None):
+    """
+    Generate all editions into a single PDF: 4-card edition, 2-card
+    edition, then the title card, two pages each.
+
+    Fonts are embedded and the shared decorations are stored only once,
+    instead of once per edition file. Each edition gets an outline entry
+    (bookmark) at its first page. content defaults to get_content().
+    """
+    register_fonts()
+    content = content or get_content()
+    buffer = io.BytesIO()
+    c = _new_canvas(buffer)
+    for key, title, draw in (
+        ("4card", "4-Card Edition", draw_4card_edition),
+        ("2card", "2-Card Edition", draw_2card_edition),
+        ("title", "Title Card", draw_title_card_edition),
+    ):
+        c.bookmarkPage(key)
+        c.addOutlineEntry(title, key)
+        draw(c, content)
+    c.showOutline()
+    _save_pdf(c, buffer, output_path)
 
 
 # =============================================================================
 # MAIN
 # =============================================================================
 
-def main():
-    """Generate all KABUL card editions."""
+def _generate_edition(generate, output_path, content):
+    """
+    Worker entry point for one PDF.
+
+    Fonts are registered per process, so every worker registers them itself.
+    """
+    register_fonts()
+    generate(output_path, content)
+
+
+def main(combined=False):
+    """
+    Generate all KABUL card editions.
+
+    By default every edition is written to its own PDF; with combined=True
+    (--all on the command line) they go into one PDF via generate_all().
+    """
     print("=" * 50)
     print(f"KABUL Card Generator (Language: {LANGUAGE.upper()})")
     print("=" * 50)
 
-    register_fonts()
     os.makedirs(OUTPUT_DIR, exist_ok=True)
+    content = get_content()
 
-    # Generate all editions with language suffix
+    # Generate all editions with language suffix. The PDFs share no state,
+    # so each one is rendered in its own process.
     lang_suffix = f"_{LANGUAGE}"
-    generate_4card_edition(f"{OUTPUT_DIR}/kabul_cards_4card{lang_suffix}.pdf")
-    generate_2card_edition(f"{OUTPUT_DIR}/kabul_cards_2card{lang_suffix}.pdf")
-    generate_title_card(f"{OUTPUT_DIR}/kabul_cards_title{lang_suffix}.pdf")
+    if combined:
+        jobs = [
+            ("All Editions", generate_all,
+             f"{OUTPUT_DIR}/kabul_cards_all{lang_suffix}.pdf"),
+        ]
+    else:
+        jobs = [
+            ("4-Card Edition", generate_4card_edition,
+             f"{OUTPUT_DIR}/kabul_cards_4card{lang_suffix}.pdf"),
+            ("2-Card Edition", generate_2card_edition,
+             f"{OUTPUT_DIR}/kabul_cards_2card{lang_suffix}.pdf"),
+            ("Title Card", generate_title_card,
+             f"{OUTPUT_DIR}/kabul_cards_title{lang_suffix}.pdf"),
+        ]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {
+            executor.submit(_generate_edition, generate, output_path, content):
+                (label, output_path)
+            for label, generate, output_path in jobs
+        }
+        # Report each edition as it finishes; result() re-raises worker errors
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+            label, output_path = futures[future]
+            print(f"✓ {label} ({LANGUAGE.upper()}): {output_path}")
 
     print()
     if LANGUAGE == "de":
@@ -1226,4 +1279,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    logging.basicConfig(format="%(levelname)s: %(message)s")
+    main(combined="--all" in sys.argv[1:])
\ No newline at end of file